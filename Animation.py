@@ -0,0 +1,140 @@
+import os
+import subprocess
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+import pandas as pd
+import geopandas as gpd
+import matplotlib
+matplotlib.use('Agg')
+import matplotlib.pyplot as plt
+from matplotlib.colors import LinearSegmentedColormap, Normalize
+from PIL import Image
+
+
+METADATA_CSV_PATH = "UNICEF Metadata.csv"
+SHAPEFILE_PATH = 'Natural Earth Countries 10m'
+OUTPUT_DIR = "animation_frames"
+
+VARIABLE_TO_PLOT_MAP = 'Life expectancy at birth, total (years)'
+YEARS = range(1960, 2023)
+
+# Same fill scale as plot 6 in Main.py
+COLOR_MAP = LinearSegmentedColormap.from_list('lightyellow_darkred', ['lightyellow', 'darkred'])
+COLOR_MAP.set_bad('lightgrey')
+
+
+def load_map_values(variable, years=YEARS, metadata_path=METADATA_CSV_PATH, shapefile_path=SHAPEFILE_PATH):
+    """Loads the world map once and a (country x year) value matrix aligned to its rows."""
+    world_map = gpd.read_file(shapefile_path)[['ADMIN', 'geometry']]
+    metadata_df = pd.read_csv(metadata_path, usecols=['country', 'year', variable])
+    metadata_df['year'] = pd.to_numeric(metadata_df['year'], errors='coerce')
+
+    values = metadata_df.pivot_table(index='country', columns='year', values=variable)
+    values = values.reindex(index=world_map['ADMIN'], columns=list(years))
+    matched_countries = values.notna().any(axis=1).sum()
+    if matched_countries < metadata_df['country'].nunique() / 2:
+        print("Warning: Low merge success rate. Check country name matching between shapefile ('ADMIN') and CSV ('country').")
+    return world_map, values
+
+
+class MapAnimator:
+    """Draws the country geometry once and re-colours it for each frame."""
+
+    def __init__(self, world_map, values, variable, dpi=100, figure_size=(12, 8)):
+        self.values = values
+        self.variable = variable
+        self.fig, self.ax = plt.subplots(figsize=figure_size, dpi=dpi)
+        self.ax.set_axis_off()
+
+        # Fixed colour scale across all years so frames are comparable
+        norm = Normalize(vmin=np.nanmin(values.values), vmax=np.nanmax(values.values))
+        world_map.plot(ax=self.ax, color='lightgrey', edgecolor='gray', linewidth=0.5)
+        self.collection = self.ax.collections[0]
+        self.collection.set_cmap(COLOR_MAP)
+        self.collection.set_norm(norm)
+        self.fig.colorbar(self.collection, ax=self.ax, shrink=0.6, label=variable)
+        self.title = self.ax.set_title('')
+        self.fig.tight_layout()
+
+    def render(self, year):
+        """Updates fill colours and title for one year and returns the frame as an RGB array."""
+        self.collection.set_array(np.ma.masked_invalid(self.values[year].to_numpy()))
+        self.title.set_text(f"{self.variable} ({year})")
+        self.fig.canvas.draw()
+        return np.asarray(self.fig.canvas.buffer_rgba())[:, :, :3].copy()
+
+    def frames(self):
+        """Yields (year, frame) for every year in the value matrix."""
+        for year in self.values.columns:
+            yield year, self.render(year)
+
+
+def write_png_sequence(frames, output_dir=OUTPUT_DIR, workers=None):
+    """Encodes frames to numbered PNG files in parallel while rendering continues."""
+    os.makedirs(output_dir, exist_ok=True)
+
+    def save(year, frame):
+        path = os.path.join(output_dir, f"frame_{year}.png")
+        Image.fromarray(frame).save(path, optimize=False)
+        return path
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(save, year, frame) for year, frame in frames]
+        return [future.result() for future in futures]
+
+
+def write_gif(frames, output_path, fps=4, workers=None):
+    """Quantizes frames to palettes in parallel and writes an animated GIF."""
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        futures = [pool.submit(lambda frame: Image.fromarray(frame).quantize(colors=256), frame)
+                   for _, frame in frames]
+        images = [future.result() for future in futures]
+    images[0].save(output_path, save_all=True, append_images=images[1:], duration=int(1000 / fps), loop=0)
+    return output_path
+
+
+def write_mp4(frames, output_path, fps=4):
+    """Streams raw frames to ffmpeg, which encodes them on multiple threads."""
+    process = None
+    for _, frame in frames:
+        if process is None:
+            height, width = frame.shape[:2]
+            process = subprocess.Popen(
+                ['ffmpeg', '-y', '-loglevel', 'error', '-f', 'rawvideo', '-pix_fmt', 'rgb24',
+                 '-s', f"{width}x{height}", '-r', str(fps), '-i', '-',
+                 '-vf', 'pad=ceil(iw/2)*2:ceil(ih/2)*2', '-pix_fmt', 'yuv420p', '-threads', '0', output_path],
+                stdin=subprocess.PIPE)
+        process.stdin.write(frame.tobytes())
+    process.stdin.close()
+    if process.wait() != 0:
+        raise RuntimeError(f"ffmpeg failed while writing {output_path}")
+    return output_path
+
+
+def animate_map(variable=VARIABLE_TO_PLOT_MAP, years=YEARS, output='gif', output_path=None, fps=4):
+    """Renders a multi-year map animation of a metadata column as 'png', 'gif' or 'mp4'."""
+    start = time.perf_counter()
+    world_map, values = load_map_values(variable, years)
+    animator = MapAnimator(world_map, values, variable)
+    slug = variable.replace(' ', '_').lower()
+
+    if output == 'png':
+        result = write_png_sequence(animator.frames(), output_path or os.path.join(OUTPUT_DIR, slug))
+    elif output == 'gif':
+        result = write_gif(animator.frames(), output_path or f"animation_map_{slug}.gif", fps=fps)
+    elif output == 'mp4':
+        result = write_mp4(animator.frames(), output_path or f"animation_map_{slug}.mp4", fps=fps)
+    else:
+        raise ValueError(f"Unknown output '{output}', expected 'png', 'gif' or 'mp4'")
+    plt.close(animator.fig)
+
+    print(f"Rendered {values.shape[1]} frames of '{variable}' in {time.perf_counter() - start:.1f}s")
+    return result
+
+
+if __name__ == "__main__":
+    import sys
+
+    animate_map(output=sys.argv[1] if len(sys.argv) > 1 else 'gif')
@@ -0,0 +1,197 @@
+import glob
+import gzip
+import hashlib
+import os
+import re
+import shutil
+from urllib.parse import unquote, urlsplit
+
+
+OUTPUT_DIR = "bundle"
+ASSETS_DIR = "assets"
+INLINE_LIMIT = 16 * 1024  # Largest CSS/JS file inlined when inline=True
+COMPRESSIBLE = {'.html', '.css', '.js', '.json', '.svg'}
+
+ATTRIBUTE_PATTERN = re.compile(r'''(\s(?:src|href)=)(["'])([^"']+)\2''')
+CSS_URL_PATTERN = re.compile(r'''url\(\s*(["']?)([^"')]+)\1\s*\)''')
+STYLESHEET_PATTERN = re.compile(r'''<link\b[^>]*\bhref=(["'])([^"']+)\1[^>]*>''')
+CSS_TOKEN_PATTERN = re.compile(r'''((?i:url)\([^"')]*\)|"(?:\\.|[^"\\])*"|'(?:\\.|[^'\\])*'|/\*.*?\*/)''', re.S)
+SCRIPT_PATTERN = re.compile(r'''<script\b([^>]*)\bsrc=(["'])([^"']+)\2([^>]*)>\s*</script>''')
+
+
+def is_local(ref):
+    """True for references to files next to the HTML, not URLs, anchors or data URIs."""
+    parts = urlsplit(ref)
+    return not (parts.scheme or parts.netloc or ref.startswith(('#', 'data:', 'mailto:', 'javascript:')))
+
+
+def resolve(base_dir, ref):
+    """Turns a (possibly URL-encoded, query-suffixed) reference into a normalized file path."""
+    return os.path.normpath(os.path.join(base_dir, unquote(urlsplit(ref).path)))
+
+
+def minify_css(text):
+    """Strips comments and redundant whitespace from a stylesheet.
+
+    Quoted strings and url(...) values are copied untouched, and whitespace is only
+    tightened around { } ; , > (never around ':', where '.a :hover' and '.a:hover' differ).
+    """
+    def drop_comment(match):
+        token = match.group(0)
+        return '' if token.startswith('/*') and not token.startswith('/*!') else token  # Keep /*! licence */ comments
+
+    text = CSS_TOKEN_PATTERN.sub(drop_comment, text)
+    parts = CSS_TOKEN_PATTERN.split(text)
+    for i in range(0, len(parts), 2):  # Even indices fall outside strings, url(...) values and comments
+        part = re.sub(r'\s+', ' ', parts[i])
+        part = re.sub(r'\s*([{};,>])\s*', r'\1', part)
+        parts[i] = part.replace(';}', '}')
+    return ''.join(parts).strip()
+
+
+class Bundle:
+    """Collects the assets used by a set of HTML files, deduplicated by content hash."""
+
+    def __init__(self, output_dir=OUTPUT_DIR, minify=True):
+        self.output_dir = output_dir
+        self.minify = minify
+        self.assets = {}      # source path -> asset file name
+        self.contents = {}    # asset file name -> bytes
+        self.used_sources = set()
+
+    def add_asset(self, path):
+        """Registers a file (and, for CSS, the files it references) and returns its asset name."""
+        path = os.path.normpath(path)
+        if path in self.assets:
+            return self.assets[path]
+        with open(path, 'rb') as f:
+            data = f.read()
+        self.used_sources.add(path)
+
+        extension = os.path.splitext(path)[1].lower()
+        if extension == '.css':
+            text = data.decode('utf-8')
+            if self.minify and not path.endswith('.min.css'):
+                text = minify_css(text)
+            text = self.rewrite_css_urls(text, os.path.dirname(path), prefix='')
+            data = text.encode('utf-8')
+
+        name = hashlib.sha256(data).hexdigest()[:16] + extension
+        self.assets[path] = name
+        self.contents[name] = data
+        return name
+
+    def rewrite_css_urls(self, text, base_dir, prefix):
+        """Points url(...) references in a stylesheet at their bundled asset names."""
+        def replace(match):
+            ref = match.group(2)
+            if not is_local(ref) or not os.path.isfile(resolve(base_dir, ref)):
+                return match.group(0)
+            return f'url("{prefix}{self.add_asset(resolve(base_dir, ref))}")'
+        return CSS_URL_PATTERN.sub(replace, text)
+
+    def add_html(self, html_path, inline=False, inline_limit=INLINE_LIMIT):
+        """Rewrites one HTML file to use bundled assets and returns its new text."""
+        base_dir = os.path.dirname(html_path)
+        with open(html_path, encoding='utf-8') as f:
+            html = f.read()
+        relative_name = os.path.relpath(html_path)
+        depth = relative_name.count(os.sep)
+        asset_prefix = '../' * depth + ASSETS_DIR + '/'
+
+        def local_file(ref):
+            path = resolve(base_dir, ref)
+            return path if is_local(ref) and os.path.isfile(path) else None
+
+        if inline:
+            def inline_stylesheet(match):
+                path = local_file(match.group(2))
+                if 'stylesheet' not in match.group(0) or path is None or os.path.getsize(path) > inline_limit:
+                    return match.group(0)
+                self.used_sources.add(os.path.normpath(path))
+                with open(path, encoding='utf-8') as f:
+                    text = f.read()
+                if self.minify:
+                    text = minify_css(text)
+                text = self.rewrite_css_urls(text, os.path.dirname(path), prefix=asset_prefix)
+                return f'<style>{text}</style>'
+
+            def inline_script(match):
+                path = local_file(match.group(3))
+                if path is None or os.path.getsize(path) > inline_limit:
+                    return match.group(0)
+                self.used_sources.add(os.path.normpath(path))
+                with open(path, encoding='utf-8') as f:
+                    text = f.read().replace('</script', '<\\/script')
+                return f'<script{match.group(1)}{match.group(4)}>{text}</script>'
+
+            html = STYLESHEET_PATTERN.sub(inline_stylesheet, html)
+            html = SCRIPT_PATTERN.sub(inline_script, html)
+
+        def replace(match):
+            path = local_file(match.group(3))
+            if path is None or path.endswith('.html'):
+                return match.group(0)
+            return f'{match.group(1)}{match.group(2)}{asset_prefix}{self.add_asset(path)}{match.group(2)}'
+
+        return relative_name, ATTRIBUTE_PATTERN.sub(replace, html)
+
+    def write_file(self, path, data, compress):
+        """Writes a file and, for text formats, a gzip copy next to it; returns (raw, gzipped) sizes."""
+        os.makedirs(os.path.dirname(path) or '.', exist_ok=True)
+        with open(path, 'wb') as f:
+            f.write(data)
+        if compress and os.path.splitext(path)[1].lower() in COMPRESSIBLE:
+            compressed = gzip.compress(data, compresslevel=9, mtime=0)
+            with open(path + '.gz', 'wb') as f:
+                f.write(compressed)
+            return len(data), len(compressed)
+        return len(data), len(data)
+
+
+def bundle(html_paths, output_dir=OUTPUT_DIR, inline=False, minify=True, compress=True):
+    """Bundles rendered HTML files and their used assets into output_dir and reports savings."""
+    builder = Bundle(output_dir, minify=minify)
+    pages = [builder.add_html(path, inline=inline) for path in html_paths]
+
+    # Everything shipped next to the reports: the HTML files plus their *_files folders
+    source_files = set(os.path.normpath(path) for path in html_paths)
+    for path in html_paths:
+        for folder in glob.glob(os.path.join(os.path.dirname(path), '*_files')):
+            for root, _, files in os.walk(folder):
+                source_files.update(os.path.normpath(os.path.join(root, name)) for name in files
+                                    if name != '.DS_Store')
+    bytes_before = sum(os.path.getsize(path) for path in source_files)
+    unused = sorted(path for path in source_files - builder.used_sources if path not in html_paths)
+
+    # Asset names are content hashes, so files from earlier runs would otherwise pile up
+    shutil.rmtree(os.path.join(output_dir, ASSETS_DIR), ignore_errors=True)
+    bytes_after = bytes_compressed = 0
+    for relative_name, html in pages:
+        raw, packed = builder.write_file(os.path.join(output_dir, relative_name), html.encode('utf-8'), compress)
+        bytes_after += raw
+        bytes_compressed += packed
+    for name, data in builder.contents.items():
+        raw, packed = builder.write_file(os.path.join(output_dir, ASSETS_DIR, name), data, compress)
+        bytes_after += raw
+        bytes_compressed += packed
+
+    duplicates = len(builder.assets) - len(builder.contents)
+    print(f"Bundled {len(pages)} pages into '{output_dir}': {len(builder.contents)} assets "
+          f"({duplicates} duplicate references merged, {len(unused)} unused files dropped)")
+    print(f"Before: {bytes_before / 1024:.0f} KB  After: {bytes_after / 1024:.0f} KB  "
+          f"Gzipped: {bytes_compressed / 1024:.0f} KB  "
+          f"Saved: {(bytes_before - bytes_compressed) / 1024:.0f} KB "
+          f"({100 * (1 - bytes_compressed / bytes_before):.0f}%)")
+    return {'bytes_before': bytes_before, 'bytes_after': bytes_after,
+            'bytes_compressed': bytes_compressed, 'unused': unused}
+
+
+if __name__ == "__main__":
+    import sys
+
+    inline = '--inline' in sys.argv
+    html_paths = [arg for arg in sys.argv[1:] if not arg.startswith('--')]
+    if not html_paths:
+        html_paths = ["Quarto Report.html", "index.html"]
+    bundle(html_paths, inline=inline)
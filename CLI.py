@@ -0,0 +1,99 @@
+import argparse
+import time
+
+import matplotlib
+matplotlib.use('Agg')  # Headless: figures are only written to disk
+
+import Main
+from Pipeline import Pipeline
+
+
+LIFE_EXPECTANCY = 'Life expectancy at birth, total (years)'
+POPULATION = 'Population, total'
+GDP_PER_CAPITA = 'GDP per capita (constant 2015 US$)'
+BIRTH_RATE = 'Birth rate, crude (per 1,000 people)'
+
+
+def figure_requirements(year):
+    """Returns, per figure, its Main.py function and the (table, columns, year range) it reads.
+
+    A year range of None means the figure needs every year.
+    """
+    return {
+        'plot1': (Main.plot1, {'metadata': (['country', 'year', POPULATION, LIFE_EXPECTANCY],
+                                            (min(1960, year), max(2022, year)))}),
+        'plot2': (Main.plot2, {'metadata': (['country', 'year', GDP_PER_CAPITA, LIFE_EXPECTANCY, POPULATION],
+                                            (year, year))}),
+        'plot3': (Main.plot3, {'indicator': (['country', 'year', 'obs_value'], None)}),
+        'plot4': (Main.plot4, {'metadata': (['country', 'year', BIRTH_RATE], (year, year))}),
+        'plot5': (Main.plot5, {'metadata': (['country', 'year', LIFE_EXPECTANCY], None)}),
+        'plot6': (Main.plot6, {'metadata': (['country', 'year', Main.VARIABLE_TO_PLOT_MAP], (year, year)),
+                               'world_map': None}),
+    }
+
+
+def merge_requirements(selected):
+    """Unions the columns and year ranges each table must provide for the selected figures."""
+    tables = {}
+    for _, needs in selected.values():
+        for table, need in needs.items():
+            if need is None:
+                tables.setdefault(table, None)
+                continue
+            columns, years = need
+            known_columns, ranges = tables.get(table) or (set(), [])
+            tables[table] = (known_columns | set(columns), None if years is None or ranges is None
+                             else ranges + [years])
+    return tables
+
+
+def load_filtered(loader, columns, ranges):
+    """Reads only the needed columns, then keeps only rows inside the needed year ranges."""
+    df = loader(usecols=lambda col: col in columns)
+    if ranges is None:
+        return df
+    keep = False
+    for start, end in ranges:
+        keep = keep | df['year'].between(start, end)
+    return df[keep]
+
+
+def run(figures, year=Main.YEAR_OF_INTEREST):
+    """Builds only the requested figures, loading only the data they need, without opening windows."""
+    Main.SHOW_PLOTS = False
+    Main.YEAR_OF_INTEREST = year
+    Main.YEAR_TO_PLOT_MAP = year
+
+    requirements = figure_requirements(year)
+    unknown = [name for name in figures if name not in requirements]
+    if unknown:
+        raise SystemExit(f"Unknown figure(s) {unknown}; choose from {list(requirements)}")
+    selected = {name: requirements[name] for name in figures}
+    tables = merge_requirements(selected)
+
+    start = time.perf_counter()
+    pipeline = Pipeline()
+    loaders = {'metadata': Main.load_metadata, 'indicator': Main.load_indicator}
+    for table, need in tables.items():
+        if table == 'world_map':
+            pipeline.load(table, Main.load_world_map)
+        else:
+            columns, ranges = need
+            pipeline.load(table, load_filtered, loaders[table], columns, ranges)
+            print(f"Loading {table}: {len(columns)} columns, "
+                  f"years {'all' if ranges is None else ', '.join(f'{a}-{b}' for a, b in ranges)}")
+
+    for name, (function, needs) in selected.items():
+        pipeline.figure(name, function, list(needs))
+    pipeline.run()
+    print(f"Built {', '.join(figures)} in {time.perf_counter() - start:.1f}s")
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Build selected report figures headlessly.")
+    parser.add_argument('--only', default=','.join(figure_requirements(Main.YEAR_OF_INTEREST)),
+                        help="Comma-separated figures to build, e.g. plot3,plot6 (default: all)")
+    parser.add_argument('--year', type=int, default=Main.YEAR_OF_INTEREST,
+                        help="Year used by the cross-section figures (plots 1, 2, 4 and 6)")
+    args = parser.parse_args()
+    run([name.strip() for name in args.only.split(',') if name.strip()], args.year)
@@ -1,9 +1,13 @@
+import os
 import pandas as pd
 import numpy as np
 
-df_indicator1 = pd.read_csv("/Users/kshitijbhilare/Documents/Data Analytics/Unicef DAta/Sample data/UNICEF Indicator 1 copy.csv")
-df_indicator2 = pd.read_csv("/Users/kshitijbhilare/Documents/Data Analytics/Unicef DAta/Sample data/UNICEF Indicator 2 copy.csv")
-df_metadata = pd.read_csv("/Users/kshitijbhilare/Documents/Data Analytics/Unicef DAta/Sample data/UNICEF Metadata Tableau Assignment copy.csv")
+# Raw exports are read from 'Sample data' unless UNICEF_RAW_DATA_DIR points elsewhere
+SAMPLE_DATA_DIR = os.environ.get("UNICEF_RAW_DATA_DIR", "Sample data")
+
+df_indicator1 = pd.read_csv(os.path.join(SAMPLE_DATA_DIR, "UNICEF Indicator 1 copy.csv"))
+df_indicator2 = pd.read_csv(os.path.join(SAMPLE_DATA_DIR, "UNICEF Indicator 2 copy.csv"))
+df_metadata = pd.read_csv(os.path.join(SAMPLE_DATA_DIR, "UNICEF Metadata Tableau Assignment copy.csv"))
 print("First 5 rows of Indicator 1:")
 print(df_indicator1.head().to_markdown(index=False, numalign="left", stralign="left"))
 
@@ -78,3 +82,9 @@ df_indicator1.to_csv("UNICEF_Indicator_1_cleaned.csv", index=False)
 df_indicator2.to_csv("UNICEF_Indicator_2_cleaned.csv", index=False)
 df_metadata.to_csv("UNICEF_Metadata_cleaned.csv", index=False)
 
+# Optional: also write normalized, indexed tables to a local SQLite database (see Storage.py)
+WRITE_DATABASE = False
+if WRITE_DATABASE:
+    from Storage import write_database
+    write_database(df_indicator1, df_indicator2, df_metadata)
+
@@ -0,0 +1,139 @@
+import pandas as pd
+
+from Storage import normalize_year
+
+
+INDICATOR_COLUMNS = ['country', 'numeric_code', 'indicator', 'year', 'obs_value', 'sex', 'unit_of_measure',
+                     'current_age']
+DEATHS = 'Deaths aged 15 to 24'
+POPULATION = 'Population, total'
+GDP_GROWTH = 'GDP growth (annual %)'
+
+
+def decade_label(years):
+    """Buckets years into '1960s'-style labels, as used for plot 5."""
+    return (years // 10 * 10).astype(int).astype(str) + 's'
+
+
+class IndicatorRegistry:
+    """Derived indicators declared over named base tables, evaluated lazily and memoized.
+
+    Each cached result remembers the version of every base table it was computed
+    from, so replacing one base table only invalidates the indicators depending on it.
+    """
+
+    def __init__(self, tables):
+        self.tables = {}
+        self.versions = {}
+        self.definitions = {}
+        self.cache = {}
+        for name, df in tables.items():
+            self.set_table(name, df)
+
+    def set_table(self, name, df):
+        """Adds or replaces a base table; dependent cached results become stale."""
+        df = df.copy()
+        if 'year' in df.columns:
+            df['year'] = normalize_year(df['year'])
+        self.tables[name] = df
+        self.versions[name] = self.versions.get(name, 0) + 1
+
+    def register(self, name, depends_on, unit_of_measure=''):
+        """Decorator declaring a derived indicator computed from base tables or other derived indicators.
+
+        The function receives one DataFrame per dependency and returns rows with
+        country, numeric_code, year and obs_value (and optionally sex).
+        """
+        def decorator(function):
+            self.definitions[name] = (function, list(depends_on), unit_of_measure)
+            return function
+        return decorator
+
+    def base_tables(self, name):
+        """Returns the base tables an indicator depends on, directly or through other indicators."""
+        if name in self.tables:
+            return {name}
+        _, depends_on, _ = self.definitions[name]
+        return set().union(*(self.base_tables(dependency) for dependency in depends_on))
+
+    def get(self, name):
+        """Returns a base table or a derived indicator in the cleaned indicator layout."""
+        if name in self.tables:
+            return self.tables[name]
+        if name not in self.definitions:
+            raise KeyError(f"Unknown indicator '{name}'")
+
+        versions = {table: self.versions[table] for table in self.base_tables(name)}
+        cached = self.cache.get(name)
+        if cached is not None and cached[0] == versions:
+            return cached[1]
+
+        function, depends_on, unit_of_measure = self.definitions[name]
+        df = function(*(self.get(dependency) for dependency in depends_on))
+        df = df.assign(indicator=name, unit_of_measure=unit_of_measure, current_age='Total')
+        if 'sex' not in df.columns:
+            df['sex'] = 'Total'
+        df = df.dropna(subset=['obs_value'])[INDICATOR_COLUMNS].reset_index(drop=True)
+        df['decade'] = decade_label(df['year'])
+        self.cache[name] = (versions, df)
+        return df
+
+    def as_indicator_table(self, names=None):
+        """Concatenates derived indicators so they can be used like df_indicator_1/2."""
+        names = list(self.definitions) if names is None else names
+        return pd.concat([self.get(name) for name in names], ignore_index=True)
+
+
+def by_sex(df, indicator):
+    """Pivots one indicator to a (country, numeric_code, year) x sex frame."""
+    df = df[df['indicator'] == indicator]
+    return df.pivot_table(index=['country', 'numeric_code', 'year'], columns='sex', values='obs_value')
+
+
+def register_defaults(registry):
+    """Declares the derived measures the report and dashboard compute inline."""
+
+    @registry.register(f"{DEATHS}, female and male", ['indicator_2'], 'Number of deaths')
+    def deaths_both_sexes(df_indicator_2):
+        deaths = by_sex(df_indicator_2, DEATHS)
+        return deaths[['Female', 'Male']].sum(axis=1, min_count=2).rename('obs_value').reset_index()
+
+    @registry.register(f"{DEATHS} per 100,000 population", ['indicator_2', 'metadata'], 'Deaths per 100,000')
+    def deaths_per_100k(df_indicator_2, df_metadata):
+        # Total population is the denominator, so only the Total deaths row gives a meaningful rate
+        deaths = by_sex(df_indicator_2, DEATHS)
+        both_sexes = deaths[['Female', 'Male']].sum(axis=1, min_count=2)
+        total = deaths['Total'].combine_first(both_sexes) if 'Total' in deaths else both_sexes
+        deaths = total.rename('deaths').reset_index()
+        population = df_metadata[['numeric_code', 'year', POPULATION]]
+        df = deaths.merge(population, on=['numeric_code', 'year'], how='inner')
+        return df.assign(obs_value=df['deaths'] / df[POPULATION] * 100000)
+
+    @registry.register(f"{DEATHS}, female to male ratio", ['indicator_2'], 'Ratio')
+    def deaths_female_male_ratio(df_indicator_2):
+        deaths = by_sex(df_indicator_2, DEATHS)
+        return (deaths['Female'] / deaths['Male'].where(deaths['Male'] > 0)).rename('obs_value').reset_index()
+
+    @registry.register(f"{GDP_GROWTH}, 5-year average", ['metadata'], '%')
+    def gdp_growth_smoothed(df_metadata):
+        wide = df_metadata.pivot_table(index='year', columns=['country', 'numeric_code'], values=GDP_GROWTH)
+        wide = wide.reindex(range(wide.index.min(), wide.index.max() + 1))
+        smoothed = wide.rolling(5, min_periods=3).mean()
+        return smoothed.stack(['country', 'numeric_code'], future_stack=True).rename('obs_value').reset_index()
+
+    return registry
+
+
+def default_registry(df_indicator_1, df_indicator_2, df_metadata):
+    """Builds a registry over the three cleaned tables with the standard derived indicators."""
+    registry = IndicatorRegistry({'indicator_1': df_indicator_1, 'indicator_2': df_indicator_2,
+                                  'metadata': df_metadata})
+    return register_defaults(registry)
+
+
+if __name__ == "__main__":
+    registry = default_registry(pd.read_csv("UNICEF_Indicator_1_cleaned.csv"),
+                                pd.read_csv("UNICEF_Indicator_2_cleaned.csv"),
+                                pd.read_csv("UNICEF_Metadata_cleaned.csv"))
+    df_derived = registry.as_indicator_table()
+    print(df_derived.groupby('indicator')['obs_value'].describe())
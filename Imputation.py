@@ -0,0 +1,113 @@
+import numpy as np
+import pandas as pd
+
+from Storage import normalize_year
+
+
+METADATA_CSV_PATH = "UNICEF_Metadata_cleaned.csv"
+ID_COLUMNS = ['country', 'numeric_code', 'year']
+METHODS = ['linear', 'spline', 'ffill', 'nearest']
+
+
+def to_panel(df, columns):
+    """Reshapes long metadata into a wide (year x (column, country)) frame over every year in range."""
+    df = df.copy()
+    df['year'] = normalize_year(df['year'])
+    wide = df.set_index(['year', 'country'])[columns].unstack('country')
+    all_years = np.arange(wide.index.min(), wide.index.max() + 1)
+    return wide.reindex(all_years)
+
+
+def gap_bounds(wide):
+    """Returns, for every cell, the years of the previous and next observation in its series."""
+    years = pd.DataFrame(np.repeat(wide.index.to_numpy()[:, None], wide.shape[1], axis=1),
+                         index=wide.index, columns=wide.columns).where(wide.notna())
+    return years.ffill(), years.bfill()
+
+
+def fill_panel(wide, method='linear', max_gap=None, order=3):
+    """Fills gaps in every series of a wide panel at once; only gaps of at most max_gap years are filled.
+
+    The spline method needs more than `order` observations in a series; shorter
+    series fall back to linear interpolation.
+    """
+    if method == 'linear':
+        filled = wide.interpolate(method='index', limit_area='inside')
+    elif method == 'spline':
+        # Needs scipy; pandas fits one spline per series
+        filled = wide.interpolate(method='index', limit_area='inside')
+        fits = wide.columns[wide.notna().sum() > order]
+        if len(fits):
+            filled[fits] = wide[fits].interpolate(method='spline', order=order, limit_area='inside')
+    elif method == 'ffill':
+        filled = wide.ffill()
+    elif method == 'nearest':
+        previous_year, next_year = gap_bounds(wide)
+        year = pd.DataFrame(np.repeat(wide.index.to_numpy()[:, None], wide.shape[1], axis=1),
+                            index=wide.index, columns=wide.columns)
+        use_previous = (year - previous_year).le(next_year - year) | next_year.isna()
+        filled = wide.ffill().where(use_previous, wide.bfill())
+    else:
+        raise ValueError(f"Unknown method '{method}', expected one of {METHODS}")
+
+    if max_gap is not None:
+        previous_year, next_year = gap_bounds(wide)
+        if method == 'ffill':
+            gap = wide.index.to_numpy()[:, None] - previous_year
+        elif method == 'nearest':
+            year = wide.index.to_numpy()[:, None]
+            gap = np.minimum((year - previous_year).fillna(np.inf), (next_year - year).fillna(np.inf))
+        else:
+            gap = next_year - previous_year - 1
+        filled = filled.where(wide.notna() | gap.le(max_gap))
+    return filled
+
+
+def impute(df, columns=None, method='linear', max_gap=None, flag=True):
+    """Fills per-country gaps in the metadata columns, keeping the original rows.
+
+    With flag=True an '<column> imputed' boolean column marks every filled value.
+    """
+    if columns is None:
+        columns = [col for col in df.columns if col not in ID_COLUMNS]
+    wide = to_panel(df, columns)
+    filled = fill_panel(wide, method, max_gap)
+
+    long = filled.stack('country', future_stack=True)
+    long.index = long.index.set_names(['year', 'country'])
+    result = df.copy()
+    keys = pd.MultiIndex.from_arrays([normalize_year(df['year']), df['country']])
+    filled_values = long.reindex(keys)
+    for col in columns:
+        values = filled_values[col].to_numpy()
+        if flag:
+            result[f"{col} imputed"] = result[col].isna().to_numpy() & ~np.isnan(values)
+        result[col] = values
+    return result
+
+
+class PanelImputer:
+    """Caches imputed copies of one metadata table per (method, max_gap, columns)."""
+
+    def __init__(self, df):
+        self.df = df
+        self.cache = {}
+
+    def get(self, method='linear', max_gap=None, columns=None, flag=True):
+        key = (method, max_gap, tuple(columns) if columns is not None else None, flag)
+        if key not in self.cache:
+            self.cache[key] = impute(self.df, columns, method, max_gap, flag)
+        return self.cache[key]
+
+
+if __name__ == "__main__":
+    df_metadata = pd.read_csv(METADATA_CSV_PATH)
+    imputer = PanelImputer(df_metadata)
+    columns = ['GDP per capita (constant 2015 US$)', 'Military expenditure (% of GDP)',
+               'Hospital beds (per 1,000 people)']
+
+    print(f"Missing values before imputation: {df_metadata[columns].isna().sum().sum()}")
+    for method, max_gap in [('linear', 5), ('ffill', 3), ('nearest', 3)]:
+        df_filled = imputer.get(method, max_gap, columns)
+        print(f"  {method} (max gap {max_gap}): {df_filled[columns].isna().sum().sum()} missing, "
+              f"{df_filled[[f'{col} imputed' for col in columns]].sum().sum()} values filled")
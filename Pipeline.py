@@ -0,0 +1,69 @@
+import time
+from concurrent.futures import ThreadPoolExecutor, wait, FIRST_COMPLETED
+
+
+class Pipeline:
+    """Runs slow loads in background threads and builds each figure as soon as its inputs are ready.
+
+    Loads run concurrently in a thread pool from the moment they are added.
+    Figures run one at a time on the calling thread (matplotlib and plotnine are
+    not thread-safe), in whichever order their inputs become available, and are
+    called with the futures of their inputs so they can handle load errors themselves.
+    """
+
+    def __init__(self, max_workers=4):
+        self.pool = ThreadPoolExecutor(max_workers=max_workers)
+        self.loads = {}
+        self.load_times = {}
+        self.figures = []
+        self.start = time.perf_counter()
+
+    def load(self, name, function, *args, **kwargs):
+        """Starts a load immediately in the background and returns its future."""
+        def timed():
+            start = time.perf_counter()
+            try:
+                return function(*args, **kwargs)
+            finally:
+                self.load_times[name] = time.perf_counter() - start
+        self.loads[name] = self.pool.submit(timed)
+        return self.loads[name]
+
+    def figure(self, name, function, inputs=()):
+        """Registers a figure; it is called with the futures of the named loads."""
+        self.figures.append((name, function, list(inputs)))
+
+    def result(self, name):
+        """Waits for a load and returns its value (re-raising any error it hit)."""
+        return self.loads[name].result()
+
+    def run(self):
+        """Builds every figure as its inputs complete, then logs how much time the overlap saved."""
+        pending = list(self.figures)
+        figure_times = {}
+        while pending:
+            ready = [figure for figure in pending if all(self.loads[name].done() for name in figure[2])]
+            if not ready:
+                waiting = {self.loads[name] for figure in pending for name in figure[2]}
+                wait([future for future in waiting if not future.done()], return_when=FIRST_COMPLETED)
+                continue
+            name, function, inputs = ready[0]
+            pending.remove(ready[0])
+            start = time.perf_counter()
+            try:
+                function(*(self.loads[input_name] for input_name in inputs))
+            except Exception as e:
+                print(f"Error generating {name}: {e}")
+            figure_times[name] = time.perf_counter() - start
+
+        self.pool.shutdown(wait=True)
+        wall_time = time.perf_counter() - self.start
+        io_time = sum(self.load_times.values())
+        compute_time = sum(figure_times.values())
+        print(f"\nPipeline finished in {wall_time:.1f}s: loads {io_time:.1f}s, figures {compute_time:.1f}s, "
+              f"overlap saved {max(io_time + compute_time - wall_time, 0):.1f}s")
+        for name, seconds in sorted(self.load_times.items(), key=lambda item: -item[1]):
+            print(f"  load {name}: {seconds:.2f}s")
+        for name, seconds in figure_times.items():
+            print(f"  {name}: {seconds:.2f}s")
+        return figure_times
@@ -0,0 +1,106 @@
+import os
+
+import numpy as np
+import pandas as pd
+
+from Ingestion import DATA_DIR, discover_indicator_files, ingest_indicators
+from SnapshotDiff import melt_metadata
+
+
+REGIONS_CSV_PATH = "UNICEF_Regions.csv"
+METADATA_CSV_PATH = "UNICEF_Metadata_cleaned.csv"
+ROLLUP_DIR = "rollups"
+GROUPINGS = ['unicef_region', 'income_group']
+
+POPULATION = 'Population, total'
+# Counts add up across countries; every other indicator is a rate and gets a population-weighted mean
+SUM_INDICATORS = {'Deaths aged 15 to 24', POPULATION, 'GNI (current US$)'}
+
+
+def load_lookup(path=REGIONS_CSV_PATH):
+    """Reads the numeric_code -> UNICEF region / income group table."""
+    return pd.read_csv(path, usecols=['numeric_code'] + GROUPINGS, keep_default_na=False)
+
+
+def load_long(metadata_path=METADATA_CSV_PATH, data_dir=DATA_DIR):
+    """Returns every indicator and metadata column as (numeric_code, indicator, year, sex, obs_value) rows."""
+    df_indicators = ingest_indicators(data_dir)
+    df_metadata = melt_metadata(pd.read_csv(metadata_path))
+    columns = ['numeric_code', 'indicator', 'year', 'sex', 'obs_value']
+    df = pd.concat([df_indicators[columns].astype({'indicator': str, 'sex': str}), df_metadata[columns]],
+                   ignore_index=True)
+    return df.astype({'year': int})
+
+
+def rollup(df_long, lookup, grouping='unicef_region'):
+    """Aggregates every indicator and year to a grouping in one grouped pass.
+
+    Returns rows in the indicator layout with the group name in the 'country'
+    column, so the plot helpers can use regions in place of countries.
+    """
+    population = (df_long[df_long['indicator'] == POPULATION][['numeric_code', 'year', 'obs_value']]
+                  .rename(columns={'obs_value': 'population'}))
+    df = (df_long.merge(lookup[['numeric_code', grouping]], on='numeric_code', how='inner')
+          .merge(population, on=['numeric_code', 'year'], how='left'))
+    df = df[df[grouping] != '']
+
+    weight = df['population'].where(df['obs_value'].notna())
+    df = df.assign(weighted=df['obs_value'] * weight, weight=weight)
+    grouped = df.groupby([grouping, 'indicator', 'year', 'sex']).agg(
+        obs_sum=('obs_value', 'sum'), weighted=('weighted', 'sum'), weight=('weight', 'sum'),
+        countries=('obs_value', 'count'))
+
+    weighted_mean = grouped['weighted'] / grouped['weight'].replace(0, np.nan)
+    is_sum = grouped.index.get_level_values('indicator').isin(SUM_INDICATORS)
+    grouped['obs_value'] = np.where(is_sum, grouped['obs_sum'], weighted_mean)
+    grouped['aggregation'] = np.where(is_sum, 'sum', 'population-weighted mean')
+
+    result = grouped[grouped['countries'] > 0].reset_index().rename(columns={grouping: 'country'})
+    return result[['country', 'indicator', 'year', 'sex', 'obs_value', 'aggregation', 'countries']]
+
+
+class RollupCache:
+    """Materializes rollup tables as CSV files and rebuilds them only when an input file is newer."""
+
+    def __init__(self, rollup_dir=ROLLUP_DIR, input_paths=(REGIONS_CSV_PATH, METADATA_CSV_PATH)):
+        self.rollup_dir = rollup_dir
+        self.input_paths = list(input_paths)
+        self.tables = {}      # grouping -> (rollup, inputs mtime it was built from)
+        self.df_long = None
+        self.long_mtime = None
+
+    def inputs_mtime(self):
+        paths = self.input_paths + discover_indicator_files()
+        return max(os.path.getmtime(path) for path in paths)
+
+    def get(self, grouping='unicef_region'):
+        """Returns the rollup for a grouping, from memory, from disk, or freshly computed.
+
+        The inputs are checked on every call, so a long-running caller picks up new files.
+        """
+        inputs_mtime = self.inputs_mtime()
+        if grouping in self.tables:
+            df, built_mtime = self.tables[grouping]
+            if built_mtime >= inputs_mtime:
+                return df
+        path = os.path.join(self.rollup_dir, f"rollup_{grouping}.csv")
+        if os.path.exists(path) and os.path.getmtime(path) >= inputs_mtime:
+            df = pd.read_csv(path)
+        else:
+            if self.df_long is None or self.long_mtime < inputs_mtime:
+                self.df_long = load_long()
+                self.long_mtime = inputs_mtime
+            df = rollup(self.df_long, load_lookup(), grouping)
+            os.makedirs(self.rollup_dir, exist_ok=True)
+            df.to_csv(path, index=False)
+        self.tables[grouping] = (df, inputs_mtime)
+        return df
+
+if __name__ == "__main__":
+    cache = RollupCache()
+    for grouping in GROUPINGS:
+        df_rollup = cache.get(grouping)
+        latest = df_rollup[(df_rollup['indicator'] == 'Life expectancy at birth, total (years)') &
+                           (df_rollup['year'] == 2021)]
+        print(f"\nLife expectancy at birth by {grouping} (2021, population-weighted):")
+        print(latest[['country', 'obs_value', 'countries']].to_string(index=False))
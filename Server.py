@@ -0,0 +1,340 @@
+import asyncio
+import hashlib
+import json
+import os
+import time
+from collections import OrderedDict
+from urllib.parse import urlsplit, parse_qs
+
+import pandas as pd
+
+from Dashboard import load_data, filter_indicator_data
+
+try:
+    import pyarrow as pa
+except ImportError:  # Arrow output is optional, JSON always works
+    pa = None
+
+
+HOST = "127.0.0.1"
+PORT = 8050
+CACHE_SIZE = 512
+FORMATS = ('json', 'arrow')
+
+DATA_FILES = [
+    "UNICEF_Indicator_1_cleaned.csv",
+    "UNICEF_Indicator_2_cleaned.csv",
+    "UNICEF_Metadata_cleaned.csv",
+]
+
+ID_COLUMNS = ['country', 'numeric_code', 'year']
+SEXES = ('Total', 'Female', 'Male')
+
+
+def build_long_table(df_indicator_1, df_indicator_2, df_metadata):
+    """Stacks both indicator tables and the melted metadata into one long table."""
+    df_metadata = df_metadata.copy()
+    df_metadata['year'] = pd.to_datetime(df_metadata['year'].astype(str), errors='coerce').dt.year
+    value_columns = [col for col in df_metadata.columns if col not in ID_COLUMNS]
+    df_metadata_long = df_metadata.melt(id_vars=ID_COLUMNS, value_vars=value_columns,
+                                        var_name='indicator', value_name='obs_value')
+    df_metadata_long = df_metadata_long.dropna(subset=['obs_value'])
+    df_metadata_long['sex'] = 'Total'
+
+    columns = ID_COLUMNS + ['indicator', 'sex', 'obs_value']
+    df_long = pd.concat([df_indicator_1[columns], df_indicator_2[columns], df_metadata_long[columns]],
+                        ignore_index=True)
+    df_long['year'] = pd.to_numeric(df_long['year'], errors='coerce').astype('Int64')
+    df_long['country'] = df_long['country'].astype('category')
+    df_long['indicator'] = df_long['indicator'].astype('category')
+    df_long['sex'] = df_long['sex'].astype('category')
+    return df_long
+
+
+def sex_totals(df, keys):
+    """Returns one value per keys group: the sex='Total' row if there is one, else Female + Male."""
+    totals = df[df['sex'] == 'Total'].set_index(keys)['obs_value']
+    parts = (df[df['sex'].isin(['Female', 'Male'])]
+             .groupby(keys, observed=True)['obs_value'].sum(min_count=1))
+    return totals.combine_first(parts)
+
+
+class ResponseCache:
+    """Small LRU cache of encoded responses keyed by the normalized request."""
+
+    def __init__(self, max_size=CACHE_SIZE):
+        self.max_size = max_size
+        self.entries = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key):
+        entry = self.entries.get(key)
+        if entry is None:
+            self.misses += 1
+            return None
+        self.entries.move_to_end(key)
+        self.hits += 1
+        return entry
+
+    def put(self, key, entry):
+        self.entries[key] = entry
+        self.entries.move_to_end(key)
+        while len(self.entries) > self.max_size:
+            self.entries.popitem(last=False)
+
+    def clear(self):
+        self.entries.clear()
+
+
+class DataStore:
+    """Keeps the UNICEF tables resident and reloads them when the cleaned files change."""
+
+    def __init__(self, data_files=DATA_FILES):
+        self.data_files = data_files
+        self.cache = ResponseCache()
+        self.signature = None
+        self.df_long = None
+        self.lock = asyncio.Lock()
+        self.refresh()
+
+    def file_signature(self):
+        """Returns the (mtime, size) of every data file, used to detect changes."""
+        signature = []
+        for path in self.data_files:
+            stat = os.stat(path)
+            signature.append((path, stat.st_mtime_ns, stat.st_size))
+        return tuple(signature)
+
+    def load(self):
+        """Reads the files and builds the long table without touching the store's state."""
+        signature = self.file_signature()
+        df_indicator_1, df_indicator_2, df_metadata = load_data()
+        return signature, build_long_table(df_indicator_1, df_indicator_2, df_metadata)
+
+    def apply(self, signature, df_long):
+        """Swaps in freshly loaded data and drops cached responses."""
+        self.signature = signature
+        self.df_long = df_long
+        self.cache.clear()
+
+    def refresh(self):
+        """Reloads the data and drops cached responses if any file has changed."""
+        if self.file_signature() == self.signature:
+            return False
+        self.apply(*self.load())
+        return True
+
+    async def refresh_async(self):
+        """Like refresh, but reads the files in a worker thread so the event loop keeps serving.
+
+        The lock makes concurrent requests wait for one reload instead of each starting their own.
+        """
+        if self.file_signature() == self.signature:
+            return False
+        async with self.lock:
+            if self.file_signature() == self.signature:
+                return False
+            self.apply(*await asyncio.to_thread(self.load))
+        return True
+
+    def country_series(self, country, indicator):
+        """Returns one country's time series for an indicator."""
+        df = filter_indicator_data(self.df_long, country, indicator)
+        return df[['year', 'sex', 'obs_value']].sort_values(['sex', 'year'])
+
+    def year_cross_section(self, year, indicator):
+        """Returns every country's value for an indicator in a given year."""
+        df = self.df_long[(self.df_long['year'] == year) & (self.df_long['indicator'] == indicator)]
+        return df[['country', 'numeric_code', 'sex', 'obs_value']].sort_values('country')
+
+    def top_k(self, indicator, year, k=20, sex='Total'):
+        """Returns the k countries with the highest value for an indicator and year."""
+        if sex not in SEXES:
+            raise ValueError(f"unknown sex '{sex}', expected one of {list(SEXES)}")
+        df = self.year_cross_section(year, indicator)
+        if sex == 'Total':
+            df = sex_totals(df, ['country', 'numeric_code']).reset_index()
+        else:
+            df = df[df['sex'] == sex]
+        return df.nlargest(k, 'obs_value')
+
+    def indicator_pair(self, x, y, year=None):
+        """Joins the sex='Total' values of two indicators on country and year."""
+        df = self.df_long if year is None else self.df_long[self.df_long['year'] == year]
+        keys = ['country', 'numeric_code', 'year']
+        df_x = sex_totals(df[df['indicator'] == x], keys).rename(x)
+        df_y = sex_totals(df[df['indicator'] == y], keys).rename(y)
+        return pd.concat([df_x, df_y], axis=1, join='inner').reset_index()
+
+
+def encode_frame(df, fmt):
+    """Encodes a DataFrame as compact column-oriented JSON or as an Arrow IPC stream."""
+    if fmt == 'arrow':
+        if pa is None:
+            raise ValueError("Arrow output requires pyarrow: pip install pyarrow")
+        table = pa.Table.from_pandas(df, preserve_index=False)
+        sink = pa.BufferOutputStream()
+        with pa.ipc.new_stream(sink, table.schema) as writer:
+            writer.write_table(table)
+        return sink.getvalue().to_pybytes(), 'application/vnd.apache.arrow.stream'
+    payload = {col: df[col].astype(object).where(df[col].notna(), None).tolist() for col in df.columns}
+    body = json.dumps(payload, separators=(',', ':'), default=str).encode('utf-8')
+    return body, 'application/json'
+
+
+def query_frame(store, path, params):
+    """Dispatches an endpoint path and its query parameters to the DataStore."""
+    def param(name, default=None, cast=str):
+        values = params.get(name)
+        if not values:
+            if default is None:
+                raise KeyError(name)
+            return default
+        return cast(values[0])
+
+    if path == '/series':
+        return store.country_series(param('country'), param('indicator'))
+    if path == '/cross-section':
+        return store.year_cross_section(param('year', cast=int), param('indicator'))
+    if path == '/top':
+        return store.top_k(param('indicator'), param('year', cast=int), param('k', 20, int), param('sex', 'Total'))
+    if path == '/pair':
+        year = param('year', cast=int) if 'year' in params else None
+        return store.indicator_pair(param('x'), param('y'), year)
+    raise LookupError(path)
+
+
+def handle_request(store, target, if_none_match=None):
+    """Returns (status, headers, body) for a GET target, serving from the cache when possible.
+
+    The caller is responsible for refreshing the store first (see DataStore.refresh_async).
+    """
+    url = urlsplit(target)
+    params = parse_qs(url.query)
+    fmt = params.get('format', ['json'])[0]
+    if fmt not in FORMATS:
+        return 400, {}, json.dumps({"error": f"unknown format '{fmt}', expected one of {list(FORMATS)}"}).encode('utf-8')
+    key = (url.path, tuple(sorted((k, tuple(v)) for k, v in params.items())))
+
+    entry = store.cache.get(key)
+    if entry is None:
+        try:
+            df = query_frame(store, url.path, params)
+            body, content_type = encode_frame(df, fmt)
+        except (KeyError, ValueError) as e:
+            # KeyError is a LookupError, so it has to be caught before the unknown-endpoint case
+            return 400, {}, json.dumps({"error": f"bad parameter: {e}"}).encode('utf-8')
+        except LookupError:
+            return 404, {}, b'{"error":"unknown endpoint"}'
+        etag = '"' + hashlib.sha1(body).hexdigest() + '"'
+        entry = (etag, content_type, body)
+        store.cache.put(key, entry)
+
+    etag, content_type, body = entry
+    headers = {'ETag': etag, 'Content-Type': content_type, 'Cache-Control': 'no-cache'}
+    if if_none_match == etag:
+        return 304, headers, b''
+    return 200, headers, body
+
+
+REASONS = {200: 'OK', 304: 'Not Modified', 400: 'Bad Request', 404: 'Not Found', 405: 'Method Not Allowed'}
+
+
+async def serve_connection(store, reader, writer):
+    """Serves HTTP/1.1 keep-alive requests on one connection."""
+    try:
+        while True:
+            request_line = await reader.readline()
+            if not request_line:
+                break
+            method, target, _ = request_line.decode('latin-1').split(' ', 2)
+            request_headers = {}
+            while True:
+                line = await reader.readline()
+                if line in (b'\r\n', b'\n', b''):
+                    break
+                name, _, value = line.decode('latin-1').partition(':')
+                request_headers[name.strip().lower()] = value.strip()
+
+            if method != 'GET':
+                status, headers, body = 405, {}, b''
+            else:
+                await store.refresh_async()
+                status, headers, body = handle_request(store, target, request_headers.get('if-none-match'))
+
+            head = [f"HTTP/1.1 {status} {REASONS[status]}", f"Content-Length: {len(body)}"]
+            head += [f"{name}: {value}" for name, value in headers.items()]
+            writer.write(('\r\n'.join(head) + '\r\n\r\n').encode('latin-1') + body)
+            await writer.drain()
+            if request_headers.get('connection', '').lower() == 'close':
+                break
+    except (ConnectionError, ValueError):
+        pass
+    finally:
+        writer.close()
+
+
+async def run_server(host=HOST, port=PORT):
+    """Loads the data once and serves it until cancelled."""
+    store = DataStore()
+    server = await asyncio.start_server(lambda r, w: serve_connection(store, r, w), host, port)
+    print(f"Serving UNICEF data on http://{host}:{port}")
+    async with server:
+        await server.serve_forever()
+
+
+async def fetch(reader, writer, target, host):
+    """Sends one keep-alive GET and reads the response; returns the status code."""
+    writer.write(f"GET {target} HTTP/1.1\r\nHost: {host}\r\n\r\n".encode('latin-1'))
+    await writer.drain()
+    status = int((await reader.readline()).split()[1])
+    length = 0
+    while True:
+        line = await reader.readline()
+        if line in (b'\r\n', b''):
+            break
+        if line.lower().startswith(b'content-length:'):
+            length = int(line.split(b':')[1])
+    await reader.readexactly(length)
+    return status
+
+
+async def benchmark(targets, concurrency=32, requests_per_client=200, host=HOST, port=PORT):
+    """Hammers a running server with concurrent keep-alive clients and reports throughput."""
+    latencies = []
+
+    async def client(offset):
+        reader, writer = await asyncio.open_connection(host, port)
+        for i in range(requests_per_client):
+            start = time.perf_counter()
+            await fetch(reader, writer, targets[(offset + i) % len(targets)], host)
+            latencies.append(time.perf_counter() - start)
+        writer.close()
+
+    start = time.perf_counter()
+    await asyncio.gather(*(client(i) for i in range(concurrency)))
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    print(f"{len(latencies)} requests with {concurrency} clients in {elapsed:.2f}s "
+          f"({len(latencies) / elapsed:.0f} req/s, "
+          f"p50 {latencies[len(latencies) // 2] * 1000:.1f} ms, "
+          f"p99 {latencies[int(len(latencies) * 0.99)] * 1000:.1f} ms)")
+
+
+BENCHMARK_TARGETS = [
+    "/series?country=India&indicator=Deaths%20aged%2015%20to%2024",
+    "/series?country=Afghanistan&indicator=Life%20expectancy%20at%20birth%2C%20total%20(years)",
+    "/cross-section?year=2021&indicator=Life%20expectancy%20at%20birth%2C%20total%20(years)",
+    "/top?indicator=Proportion%20of%20health%20care%20facilities%20with%20no%20sanitation%20service&year=2021&k=20",
+    "/pair?x=GDP%20per%20capita%20(constant%202015%20US%24)&y=Deaths%20aged%2015%20to%2024&year=2000",
+]
+
+if __name__ == "__main__":
+    import sys
+
+    if len(sys.argv) > 1 and sys.argv[1] == 'benchmark':
+        asyncio.run(benchmark(BENCHMARK_TARGETS))
+    else:
+        asyncio.run(run_server())
@@ -0,0 +1,111 @@
+import json
+import os
+
+import numpy as np
+import pandas as pd
+
+from Ingestion import ingest_indicators
+
+
+KEY_COLUMNS = ['country', 'numeric_code', 'year', 'indicator', 'sex', 'current_age']
+VALUE_COLUMN = 'obs_value'
+TOLERANCE = 1e-9  # Relative change below which a value counts as unchanged
+CHANGESET_PATH = "changeset.json"
+
+# Which report figures read which indicators; Main.py plots 1, 2, 4, 5 and 6 use the metadata table
+FIGURE_INDICATORS = {
+    'plot1': ['Life expectancy at birth, total (years)', 'Population, total'],
+    'plot2': ['GDP per capita (constant 2015 US$)', 'Life expectancy at birth, total (years)', 'Population, total'],
+    'plot3': ['Proportion of health care facilities with no sanitation service'],
+    'plot4': ['Birth rate, crude (per 1,000 people)'],
+    'plot5': ['Life expectancy at birth, total (years)'],
+    'plot6': ['Life expectancy at birth, total (years)'],
+}
+
+
+def melt_metadata(df_metadata):
+    """Turns the wide metadata table into indicator rows so it can be diffed on the same key."""
+    df_metadata = df_metadata.drop(columns=['alpha_2_code', 'alpha_3_code'], errors='ignore')
+    df = df_metadata.melt(id_vars=['country', 'numeric_code', 'year'], var_name='indicator',
+                          value_name=VALUE_COLUMN).dropna(subset=[VALUE_COLUMN])
+    df['year'] = pd.to_datetime(df['year'].astype(str), errors='coerce').dt.year
+    return df.assign(sex='Total', current_age='Total')
+
+
+def load_snapshot(data_dir):
+    """Loads every indicator file and the metadata table of one snapshot directory as long rows."""
+    frames = [ingest_indicators(data_dir)]
+    metadata_path = os.path.join(data_dir, "UNICEF_Metadata_cleaned.csv")
+    if os.path.exists(metadata_path):
+        frames.append(melt_metadata(pd.read_csv(metadata_path)))
+    df = pd.concat([frame[KEY_COLUMNS + [VALUE_COLUMN]] for frame in frames], ignore_index=True)
+    df = df.dropna(subset=['numeric_code', 'year'])
+    return df.astype({'country': str, 'numeric_code': int, 'year': int, 'indicator': str, 'sex': str,
+                      'current_age': str})
+
+
+def key_hash(df):
+    """Hashes the composite key of every row into one uint64, so the join is on a single column."""
+    return pd.util.hash_pandas_object(df[KEY_COLUMNS].astype(str), index=False).to_numpy()
+
+
+def diff_snapshots(df_old, df_new, tolerance=TOLERANCE):
+    """Hash-joins two snapshots on the composite key and labels rows added, removed or changed."""
+    old = df_old.assign(key=key_hash(df_old)).drop_duplicates('key').set_index('key')
+    new = df_new.assign(key=key_hash(df_new)).drop_duplicates('key').set_index('key')
+
+    joined = old[[VALUE_COLUMN]].join(new, how='outer', lsuffix='_old')
+    joined[KEY_COLUMNS] = joined[KEY_COLUMNS].fillna(old[KEY_COLUMNS].reindex(joined.index))
+    joined = joined.rename(columns={f'{VALUE_COLUMN}_old': 'value_old', VALUE_COLUMN: 'value_new'})
+
+    status = np.select(
+        [~joined.index.isin(old.index),
+         ~joined.index.isin(new.index),
+         ~np.isclose(joined['value_old'], joined['value_new'], rtol=tolerance, atol=0, equal_nan=True)],
+        ['added', 'removed', 'changed'], default='unchanged')
+    changes = joined.assign(status=status)
+    changes = changes[changes['status'] != 'unchanged'].reset_index(drop=True)
+    return changes.astype({'numeric_code': int, 'year': int})
+
+
+def summarize(changes):
+    """Counts added, removed and changed observations per indicator and country."""
+    return (changes.groupby(['indicator', 'country', 'status']).size()
+            .unstack('status', fill_value=0).reset_index())
+
+
+def affected_figures(changes, figure_indicators=FIGURE_INDICATORS):
+    """Maps each report figure to the countries whose data for it changed."""
+    figures = {}
+    for figure, indicators in figure_indicators.items():
+        countries = changes.loc[changes['indicator'].isin(indicators), 'country'].unique()
+        if len(countries):
+            figures[figure] = sorted(countries)
+    return figures
+
+
+def write_changeset(changes, path=CHANGESET_PATH):
+    """Publishes the change set as JSON for downstream figure and report steps."""
+    changeset = {
+        'counts': changes['status'].value_counts().to_dict(),
+        'summary': json.loads(summarize(changes).to_json(orient='records')),
+        'figures': affected_figures(changes),
+        'observations': json.loads(changes[KEY_COLUMNS + ['status', 'value_old', 'value_new']]
+                                   .to_json(orient='records')),
+    }
+    with open(path, 'w') as f:
+        json.dump(changeset, f, indent=1)
+    return changeset
+
+
+if __name__ == "__main__":
+    import sys
+
+    if len(sys.argv) != 3:
+        print("Usage: python SnapshotDiff.py OLD_SNAPSHOT_DIR NEW_SNAPSHOT_DIR")
+        sys.exit(1)
+    changes = diff_snapshots(load_snapshot(sys.argv[1]), load_snapshot(sys.argv[2]))
+    changeset = write_changeset(changes)
+    print(f"Changes: {changeset['counts'] or 'none'}")
+    print(f"Figures to rebuild: {changeset['figures'] or 'none'}")
+    print(f"Wrote {CHANGESET_PATH}")
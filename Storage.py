@@ -0,0 +1,209 @@
+import sqlite3
+
+import pandas as pd
+
+
+DATABASE_PATH = "UNICEF.sqlite"
+
+OBSERVATION_KEY = ['numeric_code', 'indicator_id', 'year', 'sex', 'current_age']
+
+SCHEMA = """
+CREATE TABLE IF NOT EXISTS countries (
+    numeric_code INTEGER PRIMARY KEY,
+    country TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS indicators (
+    indicator_id INTEGER PRIMARY KEY,
+    indicator TEXT NOT NULL UNIQUE,
+    unit_of_measure TEXT,
+    source TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS observations (
+    numeric_code INTEGER NOT NULL REFERENCES countries (numeric_code),
+    indicator_id INTEGER NOT NULL REFERENCES indicators (indicator_id),
+    year INTEGER NOT NULL,
+    sex TEXT NOT NULL,
+    current_age TEXT NOT NULL,
+    obs_value REAL,
+    PRIMARY KEY (numeric_code, indicator_id, year, sex, current_age)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS observations_country_year ON observations (numeric_code, year);
+CREATE INDEX IF NOT EXISTS observations_indicator_year ON observations (indicator_id, year);
+"""
+
+AGGREGATIONS = {'sum': 'SUM', 'mean': 'AVG', 'min': 'MIN', 'max': 'MAX', 'count': 'COUNT'}
+
+
+def connect(db_path=DATABASE_PATH):
+    """Opens the database and makes sure the schema exists."""
+    con = sqlite3.connect(db_path)
+    con.executescript(SCHEMA)
+    return con
+
+
+def quote(name):
+    """Quotes a column name such as 'Population, total' for use in SQL."""
+    return '"' + name.replace('"', '""') + '"'
+
+
+def normalize_year(series):
+    """Turns '1960', 1960 or '1960-01-01' into the integer year."""
+    if pd.api.types.is_datetime64_any_dtype(series):
+        return series.dt.year.astype(int)
+    years = pd.to_numeric(series, errors='coerce')
+    if years.isna().any():
+        years = years.fillna(pd.to_datetime(series.astype(str), errors='coerce').dt.year)
+    return years.astype(int)
+
+
+def write_database(df_indicator_1, df_indicator_2, df_metadata, db_path=DATABASE_PATH):
+    """Writes the cleaned tables into normalized, indexed tables, replacing earlier contents."""
+    frames = []
+    for source, df in [('UNICEF_Indicator_1', df_indicator_1), ('UNICEF_Indicator_2', df_indicator_2)]:
+        df = df.rename(columns={'time_period': 'year'}).copy()
+        df['source'] = source
+        frames.append(df)
+    df_observations = pd.concat(frames, ignore_index=True)
+    df_observations['year'] = normalize_year(df_observations['year'])
+
+    df_metadata = df_metadata.copy()
+    df_metadata['year'] = normalize_year(df_metadata['year'])
+    df_metadata = df_metadata.drop(columns=['alpha_2_code', 'alpha_3_code'], errors='ignore')
+
+    df_countries = (pd.concat([df_observations[['numeric_code', 'country']], df_metadata[['numeric_code', 'country']]])
+                    .drop_duplicates('numeric_code'))
+    df_indicators = df_observations[['indicator', 'unit_of_measure', 'source']].drop_duplicates('indicator')
+    df_indicators = df_indicators.reset_index(drop=True)
+    df_indicators.insert(0, 'indicator_id', df_indicators.index + 1)
+
+    df_observations = df_observations.merge(df_indicators[['indicator', 'indicator_id']], on='indicator')
+    df_observations = df_observations[OBSERVATION_KEY + ['obs_value']]
+
+    con = connect(db_path)
+    with con:
+        con.execute("DROP TABLE IF EXISTS metadata")
+        for table in ['observations', 'indicators', 'countries']:
+            con.execute(f"DELETE FROM {table}")
+        df_countries.to_sql('countries', con, if_exists='append', index=False)
+        df_indicators.to_sql('indicators', con, if_exists='append', index=False)
+        df_observations.to_sql('observations', con, if_exists='append', index=False, chunksize=10000)
+
+        value_columns = [col for col in df_metadata.columns if col not in ('country', 'numeric_code', 'year')]
+        column_sql = ', '.join(f"{quote(col)} REAL" for col in value_columns)
+        con.execute(f"CREATE TABLE metadata (numeric_code INTEGER NOT NULL REFERENCES countries (numeric_code), "
+                    f"year INTEGER NOT NULL, {column_sql}, PRIMARY KEY (numeric_code, year)) WITHOUT ROWID")
+        df_metadata.drop(columns=['country']).to_sql('metadata', con, if_exists='append', index=False,
+                                                     chunksize=10000)
+    con.execute("ANALYZE")
+    con.close()
+
+
+def build_filters(country=None, indicator=None, years=None, sex=None):
+    """Builds a WHERE clause and its parameters from optional filters.
+
+    country, indicator and sex accept a single value or a list; years is a single
+    year or an inclusive (start, end) tuple.
+    """
+    clauses, params = [], []
+
+    def add_in(column, value):
+        values = [value] if isinstance(value, (str, int)) else list(value)
+        clauses.append(f"{column} IN ({', '.join('?' * len(values))})")
+        params.extend(values)
+
+    if country is not None:
+        add_in('c.country', country)
+    if indicator is not None:
+        add_in('i.indicator', indicator)
+    if sex is not None:
+        add_in('o.sex', sex)
+    if isinstance(years, tuple):
+        clauses.append("o.year BETWEEN ? AND ?")
+        params.extend(years)
+    elif years is not None:
+        clauses.append("o.year = ?")
+        params.append(years)
+    where = f"WHERE {' AND '.join(clauses)}" if clauses else ""
+    return where, params
+
+
+def query_observations(country=None, indicator=None, years=None, sex=None, db_path=DATABASE_PATH):
+    """Returns indicator rows in the cleaned CSV layout, filtered inside the database."""
+    where, params = build_filters(country, indicator, years, sex)
+    sql = f"""
+        SELECT c.country, o.numeric_code, i.indicator, o.year, o.obs_value,
+               o.sex, i.unit_of_measure, o.current_age
+        FROM observations o
+        JOIN countries c ON c.numeric_code = o.numeric_code
+        JOIN indicators i ON i.indicator_id = o.indicator_id
+        {where}
+        ORDER BY o.numeric_code, i.indicator, o.sex, o.year
+    """
+    with sqlite3.connect(db_path) as con:
+        return pd.read_sql_query(sql, con, params=params)
+
+
+def query_metadata(country=None, years=None, columns=None, db_path=DATABASE_PATH):
+    """Returns metadata rows, reading only the requested countries, years and columns."""
+    where, params = build_filters(country=country, years=years)
+    where = where.replace('o.year', 'm.year')
+    with sqlite3.connect(db_path) as con:
+        if columns is None:
+            columns = [row[1] for row in con.execute("PRAGMA table_info(metadata)")
+                       if row[1] not in ('numeric_code', 'year')]
+        column_sql = ''.join(f", m.{quote(col)}" for col in columns)
+        sql = f"""
+            SELECT c.country, m.numeric_code, m.year{column_sql}
+            FROM metadata m
+            JOIN countries c ON c.numeric_code = m.numeric_code
+            {where}
+            ORDER BY m.numeric_code, m.year
+        """
+        return pd.read_sql_query(sql, con, params=params)
+
+
+def aggregate_observations(indicator, by=('year',), how='sum', country=None, years=None, sex=None,
+                           db_path=DATABASE_PATH):
+    """Aggregates obs_value for an indicator in SQL, grouped by any of country, year and sex."""
+    if how not in AGGREGATIONS:
+        raise ValueError(f"Unknown aggregation '{how}', expected one of {list(AGGREGATIONS)}")
+    group_columns = {'country': 'c.country', 'year': 'o.year', 'sex': 'o.sex'}
+    group_sql = ', '.join(group_columns[col] for col in by)
+    where, params = build_filters(country, indicator, years, sex)
+    sql = f"""
+        SELECT {group_sql}, {AGGREGATIONS[how]}(o.obs_value) AS obs_value
+        FROM observations o
+        JOIN countries c ON c.numeric_code = o.numeric_code
+        JOIN indicators i ON i.indicator_id = o.indicator_id
+        {where}
+        GROUP BY {group_sql}
+        ORDER BY {group_sql}
+    """
+    with sqlite3.connect(db_path) as con:
+        return pd.read_sql_query(sql, con, params=params)
+
+
+def load_data(db_path=DATABASE_PATH):
+    """Loads the three cleaned tables from the database, in the same shape as Dashboard.load_data.
+
+    Metadata years are stored as integers but returned as the CSV's 'YYYY-01-01' strings,
+    which is what Dashboard's pd.to_datetime(...).dt.year expects.
+    """
+    with sqlite3.connect(db_path) as con:
+        sources = pd.read_sql_query("SELECT indicator, source FROM indicators", con)
+    df_indicator_1 = query_observations(indicator=sources.loc[sources['source'] == 'UNICEF_Indicator_1', 'indicator'],
+                                        db_path=db_path)
+    df_indicator_2 = query_observations(indicator=sources.loc[sources['source'] == 'UNICEF_Indicator_2', 'indicator'],
+                                        db_path=db_path)
+    df_metadata = query_metadata(db_path=db_path)
+    df_metadata['year'] = df_metadata['year'].astype(str) + '-01-01'
+    return df_indicator_1, df_indicator_2, df_metadata
+
+
+if __name__ == "__main__":
+    write_database(pd.read_csv("UNICEF_Indicator_1_cleaned.csv"),
+                   pd.read_csv("UNICEF_Indicator_2_cleaned.csv"),
+                   pd.read_csv("UNICEF_Metadata_cleaned.csv"))
+    print(f"Wrote {DATABASE_PATH}")
+    print(query_observations(country='India', indicator='Deaths aged 15 to 24', years=(2010, 2020)).head())
+    print(aggregate_observations('Deaths aged 15 to 24', by=('year',), how='sum', sex=['Female', 'Male']).tail())
@@ -0,0 +1,203 @@
+import gzip
+import json
+import math
+import os
+import sqlite3
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+import geopandas as gpd
+import shapely
+from shapely.geometry import box
+
+from Storage import normalize_year
+
+try:
+    import mapbox_vector_tile
+except ImportError:  # Only needed for MBTiles output; GeoJSON tile directories work without it
+    mapbox_vector_tile = None
+
+
+SHAPEFILE_PATH = 'Natural Earth Countries 10m'
+METADATA_CSV_PATH = "UNICEF_Metadata_cleaned.csv"
+OUTPUT_DIR = "tiles"
+
+# (shapefile, first zoom, last zoom): build_tile simplifies to each zoom's tile unit, so the
+# 1:10m outlines come out coarse at world scale and detailed when zoomed in
+LAYERS = [
+    (SHAPEFILE_PATH, 0, 6),
+]
+
+LAYER_NAME = 'countries'
+EXTENT = 4096         # Tile coordinate resolution, as in the Mapbox Vector Tile spec
+BUFFER = 64           # Extra tile units clipped around each tile so outlines join cleanly
+EARTH_RADIUS = 6378137.0
+WORLD_EXTENT = math.pi * EARTH_RADIUS
+MAX_LATITUDE = 85.0511287798
+
+_layer = None  # Per-worker copy of the projected countries, set by load_layer
+
+
+def read_countries(path):
+    """Reads an admin-0 shapefile, keyed by ISO numeric code, in Web Mercator.
+
+    Territories without an ISO code (Natural Earth's -99) get a missing numeric_code rather
+    than a shared placeholder, so they are drawn but never joined to data.
+    """
+    world_map = gpd.read_file(path)
+    code_column = 'ISO_N3_EH' if 'ISO_N3_EH' in world_map.columns else 'ISO_N3'
+    world_map = world_map[['ADMIN', code_column, 'geometry']].rename(columns={'ADMIN': 'country',
+                                                                              code_column: 'numeric_code'})
+    codes = pd.to_numeric(world_map['numeric_code'], errors='coerce')
+    world_map['numeric_code'] = codes.where(codes > 0).astype('Int64')
+    world_map['geometry'] = world_map['geometry'].clip_by_rect(-180, -MAX_LATITUDE, 180, MAX_LATITUDE)
+    return world_map[~world_map.is_empty].to_crs(epsg=3857)
+
+
+def load_layer(path):
+    """Process-pool initializer: loads the shapefile once per worker."""
+    global _layer
+    _layer = read_countries(path)
+
+
+def tile_bounds(z, x, y):
+    """Returns the Web Mercator bounds (minx, miny, maxx, maxy) of a tile."""
+    size = 2 * WORLD_EXTENT / 2 ** z
+    minx = -WORLD_EXTENT + x * size
+    maxy = WORLD_EXTENT - y * size
+    return minx, maxy - size, minx + size, maxy
+
+
+def mercator_to_lonlat(coords):
+    """Vectorized inverse Web Mercator projection for shapely.transform."""
+    lon = np.degrees(coords[:, 0] / EARTH_RADIUS)
+    lat = np.degrees(2 * np.arctan(np.exp(coords[:, 1] / EARTH_RADIUS)) - math.pi / 2)
+    return np.column_stack([lon, lat])
+
+
+def build_tile(z, x, y, fmt):
+    """Clips, simplifies and encodes the countries touching one tile; returns None for empty tiles."""
+    bounds = tile_bounds(z, x, y)
+    unit = (bounds[2] - bounds[0]) / EXTENT
+    clip_box = box(*bounds).buffer(BUFFER * unit, join_style=2)
+    rows = _layer.iloc[_layer.sindex.query(clip_box, predicate='intersects')]
+    if rows.empty:
+        return None
+
+    geometries = shapely.simplify(shapely.intersection(rows.geometry.values, clip_box), unit / 2)
+    precision = 10.0 ** -min(7, 2 + z)  # GeoJSON coordinate grid, coarser at low zoom
+    features = []
+    for geometry, code, country in zip(geometries, rows['numeric_code'], rows['country']):
+        if geometry.is_empty:
+            continue
+        properties = {'country': country}
+        if not pd.isna(code):
+            properties['numeric_code'] = int(code)
+        if fmt == 'mbtiles':
+            features.append({'geometry': geometry, 'properties': properties})
+        else:
+            geometry = shapely.set_precision(shapely.transform(geometry, mercator_to_lonlat), precision)
+            features.append({'type': 'Feature', 'properties': properties,
+                             'geometry': shapely.geometry.mapping(geometry)})
+    if not features:
+        return None
+
+    if fmt == 'mbtiles':
+        data = mapbox_vector_tile.encode([{'name': LAYER_NAME, 'features': features}],
+                                         default_options={'quantize_bounds': bounds, 'extents': EXTENT})
+        return gzip.compress(data)
+    return json.dumps({'type': 'FeatureCollection', 'features': features}, separators=(',', ':')).encode('utf-8')
+
+
+def build_column(z, x, fmt):
+    """Builds every tile in one column of a zoom level (the unit of work sent to a worker)."""
+    tiles = []
+    for y in range(2 ** z):
+        data = build_tile(z, x, y, fmt)
+        if data is not None:
+            tiles.append((z, x, y, data))
+    return tiles
+
+
+def open_mbtiles(path):
+    """Creates an empty MBTiles file."""
+    if os.path.exists(path):
+        os.remove(path)
+    con = sqlite3.connect(path)
+    con.executescript("""
+        CREATE TABLE metadata (name TEXT, value TEXT);
+        CREATE TABLE tiles (zoom_level INTEGER, tile_column INTEGER, tile_row INTEGER, tile_data BLOB);
+        CREATE UNIQUE INDEX tile_index ON tiles (zoom_level, tile_column, tile_row);
+    """)
+    return con
+
+
+def build_pyramid(output=OUTPUT_DIR, fmt='directory', layers=LAYERS, workers=None):
+    """Builds the tile pyramid for every layer, one process pool per layer."""
+    if fmt == 'mbtiles' and mapbox_vector_tile is None:
+        raise ImportError("MBTiles output requires mapbox-vector-tile: pip install mapbox-vector-tile")
+
+    con = open_mbtiles(output) if fmt == 'mbtiles' else None
+    count = 0
+    for path, min_zoom, max_zoom in layers:
+        jobs = [(z, x) for z in range(min_zoom, max_zoom + 1) for x in range(2 ** z)]
+        with ProcessPoolExecutor(max_workers=workers, initializer=load_layer, initargs=(path,)) as pool:
+            futures = [pool.submit(build_column, z, x, fmt) for z, x in jobs]
+            for future in futures:
+                for z, x, y, data in future.result():
+                    if con is not None:
+                        # MBTiles uses TMS row numbering (origin at the bottom)
+                        con.execute("INSERT INTO tiles VALUES (?, ?, ?, ?)", (z, x, 2 ** z - 1 - y, data))
+                    else:
+                        tile_path = os.path.join(output, str(z), str(x), f"{y}.geojson")
+                        os.makedirs(os.path.dirname(tile_path), exist_ok=True)
+                        with open(tile_path, 'wb') as f:
+                            f.write(data)
+                    count += 1
+        print(f"Built zoom {min_zoom}-{max_zoom} from '{path}'")
+
+    if con is not None:
+        metadata = {'name': 'UNICEF countries', 'format': 'pbf', 'minzoom': layers[0][1],
+                    'maxzoom': layers[-1][2], 'json': json.dumps({'vector_layers': [
+                        {'id': LAYER_NAME, 'fields': {'numeric_code': 'Number', 'country': 'String'}}]})}
+        con.executemany("INSERT INTO metadata VALUES (?, ?)", [(k, str(v)) for k, v in metadata.items()])
+        con.commit()
+        con.close()
+    print(f"Wrote {count} tiles to '{output}'")
+    return count
+
+
+def export_country_index(path=SHAPEFILE_PATH, output=os.path.join(OUTPUT_DIR, 'countries.json')):
+    """Writes each country's name and lon/lat bounding box keyed by numeric code, for zoom-to-country."""
+    world_map = read_countries(path).to_crs(epsg=4326).dropna(subset=['numeric_code'])
+    index = {str(code): {'country': country, 'bbox': [round(value, 4) for value in geometry.bounds]}
+             for code, country, geometry in zip(world_map['numeric_code'], world_map['country'],
+                                                world_map.geometry)}
+    os.makedirs(os.path.dirname(output), exist_ok=True)
+    with open(output, 'w') as f:
+        json.dump(index, f, separators=(',', ':'))
+
+
+def export_values(column, metadata_path=METADATA_CSV_PATH, output_dir=os.path.join(OUTPUT_DIR, 'values')):
+    """Writes one metadata column as a small {year: {numeric_code: value}} table for client-side joins."""
+    df_metadata = pd.read_csv(metadata_path, usecols=['numeric_code', 'year', column])
+    df_metadata['year'] = normalize_year(df_metadata['year'])
+    df_metadata = df_metadata.dropna(subset=[column])
+    values = {str(year): dict(zip(group['numeric_code'].astype(str), group[column].round(4)))
+              for year, group in df_metadata.groupby('year')}
+
+    os.makedirs(output_dir, exist_ok=True)
+    output = os.path.join(output_dir, f"{column.replace(' ', '_').lower()}.json")
+    with open(output, 'w') as f:
+        json.dump({'column': column, 'values': values}, f, separators=(',', ':'))
+    return output
+
+
+if __name__ == "__main__":
+    import sys
+
+    fmt = 'mbtiles' if '--mbtiles' in sys.argv else 'directory'
+    build_pyramid(output='countries.mbtiles' if fmt == 'mbtiles' else OUTPUT_DIR, fmt=fmt)
+    export_country_index()
+    print(f"Wrote {export_values('Life expectancy at birth, total (years)')}")